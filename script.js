@@ -3,12 +3,23 @@ class LEDMatrixSimulator {
     constructor() {
         this.matrixSize = 64;
         this.matrix = [];
+        this.leds = [];
+        this.frameBuffers = null; // Effect output buffers, alternated so the frame on screen stays intact
+        this.backBufferIndex = 0;
+        this.colorPalette = new Map(); // Packed RGB -> CSS color string
+        this.colorModFrames = new WeakMap(); // Source frame -> recolored copies, indexed by color modification
+        this.spriteRuns = new WeakMap(); // Source frame -> packed runs of same-colored lit pixels
         this.currentFrame = 0;
         this.frames = [];
+        this.prerenderedFrames = null; // Scaled frames reused while no time-based effect is active
+        this.renderEffect = null; // (frame, frameIndex) => output frame for the active effects, set by updateEffectRenderer()
         this.isPlaying = false;
         this.animationSpeed = 50;
         this.animationId = null;
-        this.lastFrameTime = 0;
+        this.nextFrameTime = 0; // Deadline (performance.now() ms) for the next animation frame
+        this.movementLogInterval = 1000; // Minimum ms between bird movement debug logs
+        this.lastMovementLogTime = -Infinity;
+        this.movementLogBirdIndex = -1; // Swarm bird reported by the last movement debug log
         this.effects = {
             split: false,
             swarm: false,
@@ -70,6 +81,7 @@ class LEDMatrixSimulator {
     }
 
     init() {
+        this.updateEffectRenderer();
         this.createMatrix();
         this.loadImages();
         this.setupEventListeners();
@@ -90,6 +102,7 @@ class LEDMatrixSimulator {
                 hue: i * hueStep, // 0°, 90°, 180°, 270° for 4 birds
                 saturation: 0.8 + (i * 0.05), // Slight saturation variation
                 brightness: 0.9 + (i * 0.025), // Slight brightness variation
+                huePalette: new Map(), // Source color -> hue-shifted color, filled as the bird is drawn
                 startDelay: i * this.pollinationData.birdCycleDuration // Stagger bird starts
             });
         }
@@ -110,6 +123,7 @@ class LEDMatrixSimulator {
                 hue: hues[i],
                 saturation: 0.9,
                 brightness: 1.0,
+                huePalette: new Map(), // Source color -> hue-shifted color, filled as the bird is drawn
                 pulseOffset: i * 0.4 // Different pulsing timing for each bird
             });
         }
@@ -124,11 +138,11 @@ class LEDMatrixSimulator {
         this.updateMatrixCSS();
 
         // Initialize matrix data structure
-        this.matrix = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        this.matrix = this.createFrame();
+        this.frameBuffers = this.createFrames(2);
 
-        // Create LED elements
+        // Create LED elements, keeping references so rendering never has to query the DOM
+        this.leds = [];
         for (let y = 0; y < this.matrixSize; y++) {
             for (let x = 0; x < this.matrixSize; x++) {
                 const led = document.createElement('div');
@@ -136,10 +150,33 @@ class LEDMatrixSimulator {
                 led.dataset.x = x;
                 led.dataset.y = y;
                 matrixElement.appendChild(led);
+                this.leds.push(led);
             }
         }
     }
 
+    createFrame() {
+        // Frames are flat buffers of packed 0xRRGGBB values in row-major order (0 = LED off)
+        return new Uint32Array(this.matrixSize * this.matrixSize);
+    }
+
+    createFrames(count) {
+        // Back several frames with one contiguous buffer; each frame is a view into it
+        const frameLength = this.matrixSize * this.matrixSize;
+        const frameStore = new Uint32Array(count * frameLength);
+        return Array.from({ length: count }, (_, index) =>
+            frameStore.subarray(index * frameLength, (index + 1) * frameLength)
+        );
+    }
+
+    clearFrameBuffer() {
+        // Draw into the buffer that is not on screen; the displayed one is what renderMatrix() diffs against
+        this.backBufferIndex = 1 - this.backBufferIndex;
+        const frameBuffer = this.frameBuffers[this.backBufferIndex];
+        frameBuffer.fill(0);
+        return frameBuffer;
+    }
+
     updateMatrixCSS() {
         const matrixElement = document.getElementById('ledMatrix');
         const ledSize = this.matrixSize === 64 ? '10px' : '20px'; // Much larger LEDs to fill the space
@@ -164,6 +201,7 @@ class LEDMatrixSimulator {
 
         // Reset position to center
         this.position = { x: newSize / 2, y: newSize / 2 };
+        this.prerenderedFrames = null;
 
         // Reset move data
         this.moveData = {
@@ -182,21 +220,27 @@ class LEDMatrixSimulator {
     }
 
     async loadImages() {
+        const [frame1, frame2, flowerFrame] = this.createFrames(3);
+
+        // Only image loading falls back to the test pattern; rendering errors should surface as-is
         try {
-            const frame1 = await this.loadImageToMatrix('./hummingbird/hummingbird1.png');
-            const frame2 = await this.loadImageToMatrix('./hummingbird/hummingbird2.png');
-            const flowerFrame = await this.loadImageToMatrix('./flower/flower1.png');
-            this.frames = [frame1, frame2];
-            this.flowerFrame = flowerFrame;
-            this.displayFrame(0);
-            console.log('Images loaded successfully');
+            await this.loadImageToMatrix('./hummingbird/hummingbird1.png', frame1);
+            await this.loadImageToMatrix('./hummingbird/hummingbird2.png', frame2);
+            await this.loadImageToMatrix('./flower/flower1.png', flowerFrame);
         } catch (error) {
             console.error('Error loading images:', error);
             this.createTestPattern();
+            return;
         }
+
+        this.frames = [frame1, frame2];
+        this.flowerFrame = flowerFrame;
+        this.prerenderedFrames = null;
+        this.displayFrame(0);
+        console.log('Images loaded successfully');
     }
 
-    loadImageToMatrix(imagePath) {
+    loadImageToMatrix(imagePath, frameData = this.createFrame()) {
         return new Promise((resolve, reject) => {
             const img = new Image();
             img.crossOrigin = 'anonymous';
@@ -238,23 +282,16 @@ class LEDMatrixSimulator {
                 const imageData = ctx.getImageData(0, 0, this.matrixSize, this.matrixSize);
                 const pixelData = imageData.data;
 
-                const frameData = Array(this.matrixSize).fill().map(() =>
-                    Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-                );
-
-                for (let y = 0; y < this.matrixSize; y++) {
-                    for (let x = 0; x < this.matrixSize; x++) {
-                        const index = (y * this.matrixSize + x) * 4;
-                        const r = pixelData[index];
-                        const g = pixelData[index + 1];
-                        const b = pixelData[index + 2];
-
-                        // Skip white pixels (background)
-                        if (r > 240 && g > 240 && b > 240) {
-                            frameData[y][x] = { r: 0, g: 0, b: 0 };
-                        } else {
-                            frameData[y][x] = { r, g, b };
-                        }
+                // Pack RGBA pixel data straight into the frame buffer in one pass
+                for (let i = 0; i < frameData.length; i++) {
+                    const index = i * 4;
+                    const r = pixelData[index];
+                    const g = pixelData[index + 1];
+                    const b = pixelData[index + 2];
+
+                    // Skip white pixels (background)
+                    if (!(r > 240 && g > 240 && b > 240)) {
+                        frameData[i] = (r << 16) | (g << 8) | b;
                     }
                 }
 
@@ -268,22 +305,18 @@ class LEDMatrixSimulator {
 
     createTestPattern() {
         // Create a simple test pattern if images fail to load
-        const frame1 = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
-        const frame2 = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        const [frame1, frame2] = this.createFrames(2);
 
         // Draw a simple bird-like pattern
         for (let y = 25; y < 40; y++) {
             for (let x = 25; x < 40; x++) {
-                frame1[y][x] = { r: 255, g: 100, b: 0 };
-                frame2[y][x] = { r: 255, g: 150, b: 50 };
+                frame1[y * this.matrixSize + x] = this.packColor(255, 100, 0);
+                frame2[y * this.matrixSize + x] = this.packColor(255, 150, 50);
             }
         }
 
         this.frames = [frame1, frame2];
+        this.prerenderedFrames = null;
         this.displayFrame(0);
         console.log('Using test pattern');
     }
@@ -294,38 +327,48 @@ class LEDMatrixSimulator {
         this.currentFrame = frameIndex % this.frames.length;
         const frame = this.frames[this.currentFrame];
 
-        let displayFrame = frame;
-
         // Apply effects
+        const displayFrame = this.renderEffect(frame, this.currentFrame);
+
+        // Update matrix
+        this.renderMatrix(displayFrame);
+
+        // Frame counter removed
+    }
+
+    updateEffectRenderer() {
+        // Resolve the active effect combination once when effects change, not on every frame
         if (this.effects.pollination) {
-            displayFrame = this.applyPollinationEffect(frame);
+            this.renderEffect = frame => this.applyPollinationEffect(frame);
         } else if (this.effects.cult) {
-            displayFrame = this.applyCultEffect(frame);
+            this.renderEffect = frame => this.applyCultEffect(frame);
         } else if (this.effects.split && this.effects.swarm) {
-            displayFrame = this.applySplitSwarmEffect(frame);
+            this.renderEffect = frame => this.applySplitSwarmEffect(frame);
         } else if (this.effects.split && this.effects.move) {
-            displayFrame = this.applySplitMoveEffect(frame);
+            this.renderEffect = frame => this.applySplitMoveEffect(frame);
         } else if (this.effects.split) {
-            displayFrame = this.applySplitEffect(frame);
+            this.renderEffect = frame => this.applySplitEffect(frame);
         } else if (this.effects.swarm) {
-            displayFrame = this.applySwarmEffect(frame);
+            this.renderEffect = frame => this.applySwarmEffect(frame);
         } else if (this.effects.move) {
-            displayFrame = this.applyMoveEffect(frame);
+            this.renderEffect = frame => this.applyMoveEffect(frame);
+        } else if (this.effects.breathing) {
+            this.renderEffect = frame => this.applyScaleAndPosition(frame);
         } else {
-            displayFrame = this.applyScaleAndPosition(frame);
+            this.renderEffect = (frame, frameIndex) => this.getPrerenderedFrame(frameIndex);
         }
+    }
 
-        // Update matrix
-        this.matrix = displayFrame;
-        this.renderMatrix();
-
-        // Frame counter removed
+    getPrerenderedFrame(frameIndex) {
+        // Without breathing the scaled frames never change, so render each one once and swap between them
+        if (!this.prerenderedFrames) {
+            this.prerenderedFrames = this.createFrames(this.frames.length);
+            this.frames.forEach((frame, index) => this.applyScaleAndPosition(frame, this.prerenderedFrames[index]));
+        }
+        return this.prerenderedFrames[frameIndex];
     }
 
-    applyScaleAndPosition(frame) {
-        const newFrame = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+    applyScaleAndPosition(frame, newFrame = this.clearFrameBuffer()) {
 
         // Apply breathing effect by modulating scale
         let currentScale = this.scale;
@@ -335,35 +378,52 @@ class LEDMatrixSimulator {
             currentScale = this.scale * breathScale;
         }
 
-        const scaledSize = Math.floor(this.matrixSize * currentScale);
-        const offsetX = this.position.x - scaledSize / 2;
-        const offsetY = this.position.y - scaledSize / 2;
-
-        for (let y = 0; y < scaledSize; y++) {
-            for (let x = 0; x < scaledSize; x++) {
-                const sourceX = Math.floor(x / currentScale);
-                const sourceY = Math.floor(y / currentScale);
-                const targetX = Math.floor(offsetX + x);
-                const targetY = Math.floor(offsetY + y);
-
-                if (sourceX >= 0 && sourceX < this.matrixSize &&
-                    sourceY >= 0 && sourceY < this.matrixSize &&
-                    targetX >= 0 && targetX < this.matrixSize &&
-                    targetY >= 0 && targetY < this.matrixSize) {
-                    newFrame[targetY][targetX] = frame[sourceY][sourceX];
-                }
+        this.drawScaledFrame(newFrame, frame, this.position.x, this.position.y, currentScale);
+
+        return newFrame;
+    }
+
+    drawScaledFrame(targetFrame, sourceFrame, centerX, centerY, scale) {
+        const size = this.matrixSize;
+        const scaledSize = Math.floor(size * scale);
+        const offsetX = centerX - scaledSize / 2;
+        const offsetY = centerY - scaledSize / 2;
+
+        // Clip to the panel once up front; source coordinates always fall inside the
+        // frame (x / scale < matrixSize), so the inner loop needs no bounds checks
+        const [xStart, xEnd] = this.getClippedRange(offsetX, scaledSize);
+        const [yStart, yEnd] = this.getClippedRange(offsetY, scaledSize);
+
+        for (let y = yStart; y < yEnd; y++) {
+            // Resolve the source and target rows once per row rather than per pixel
+            const sourceRow = Math.floor(y / scale) * size;
+            const targetRow = Math.floor(offsetY + y) * size;
+
+            for (let x = xStart; x < xEnd; x++) {
+                targetFrame[targetRow + Math.floor(offsetX + x)] = sourceFrame[sourceRow + Math.floor(x / scale)];
             }
         }
+    }
 
-        return newFrame;
+    getClippedRange(offset, length) {
+        // [start, end) of i in [0, length) for which Math.floor(offset + i) lands on the panel
+        let start = Math.max(0, Math.ceil(-offset));
+        let end = Math.min(length, Math.ceil(this.matrixSize - offset));
+
+        // Nudge for floating-point rounding so the range matches the per-pixel floor exactly
+        while (start > 0 && Math.floor(offset + start - 1) >= 0) start--;
+        while (start < end && Math.floor(offset + start) < 0) start++;
+        while (end < length && Math.floor(offset + end) < this.matrixSize) end++;
+        while (end > start && Math.floor(offset + end - 1) >= this.matrixSize) end--;
+
+        return [start, end];
     }
 
     applySplitEffect(frame) {
-        const newFrame = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        const size = this.matrixSize;
+        const newFrame = this.clearFrameBuffer();
 
-        const quadrantSize = this.matrixSize / 2; // 32x32 for each quadrant
+        const quadrantSize = size / 2; // 32x32 for each quadrant
 
         // Define the 4 quadrant positions
         const quadrants = [
@@ -378,7 +438,7 @@ class LEDMatrixSimulator {
 
         // Place a scaled-down version of the bird in each quadrant with different colors
         quadrants.forEach((quadrant, quadIndex) => {
-            const modType = colorMods[quadIndex];
+            const tintedFrame = this.getColorModFrame(frame, colorMods[quadIndex], true);
 
             // Apply breathing effect with different timing for each quadrant
             let effectiveQuadrantSize = quadrantSize;
@@ -397,61 +457,19 @@ class LEDMatrixSimulator {
                 offsetQuadrantY = (quadrantSize - effectiveQuadrantSize) / 2;
             }
 
+            // The scaled copy is centered inside its quadrant, so every target pixel is on
+            // the panel and every source pixel is inside the frame; no per-pixel bounds checks
             for (let qy = 0; qy < effectiveQuadrantSize; qy++) {
-                for (let qx = 0; qx < effectiveQuadrantSize; qx++) {
-                    // Map quadrant coordinates to original image coordinates
-                    const sourceX = Math.floor((qx / effectiveQuadrantSize) * this.matrixSize);
-                    const sourceY = Math.floor((qy / effectiveQuadrantSize) * this.matrixSize);
+                // Map quadrant row to original image row and target row (centered in quadrant)
+                const sourceRow = Math.floor((qy / effectiveQuadrantSize) * size) * size;
+                const targetRow = Math.floor(quadrant.offsetY + offsetQuadrantY + qy) * size;
 
-                    // Target position in the new frame (centered in quadrant)
+                for (let qx = 0; qx < effectiveQuadrantSize; qx++) {
+                    const sourceX = Math.floor((qx / effectiveQuadrantSize) * size);
                     const targetX = Math.floor(quadrant.offsetX + offsetQuadrantX + qx);
-                    const targetY = Math.floor(quadrant.offsetY + offsetQuadrantY + qy);
-
-                    if (sourceX < this.matrixSize && sourceY < this.matrixSize &&
-                        targetX < this.matrixSize && targetY < this.matrixSize &&
-                        targetX >= 0 && targetY >= 0) {
-
-                        const sourcePixel = frame[sourceY][sourceX];
-
-                        // Only process non-black pixels
-                        if (sourcePixel.r > 0 || sourcePixel.g > 0 || sourcePixel.b > 0) {
-                            let r = sourcePixel.r;
-                            let g = sourcePixel.g;
-                            let b = sourcePixel.b;
-
-                            // Apply color modification based on quadrant
-                            if (modType === 0) {
-                                // Hue shift towards red
-                                r = Math.min(255, Math.max(30, r * 1.3));
-                                g = Math.max(20, Math.floor(g * 0.7));
-                                b = Math.max(20, Math.floor(b * 0.6));
-                            } else if (modType === 1) {
-                                // Hue shift towards blue  
-                                r = Math.max(20, Math.floor(r * 0.6));
-                                g = Math.max(20, Math.floor(g * 0.8));
-                                b = Math.min(255, Math.max(30, b * 1.4));
-                            } else if (modType === 4) {
-                                // Increase saturation and brightness
-                                r = Math.min(240, Math.max(25, r * 1.2));
-                                g = Math.min(240, Math.max(25, g * 1.2));
-                                b = Math.min(240, Math.max(25, b * 1.2));
-                            } else if (modType === 5) {
-                                // Swap color channels (ensure minimum values)
-                                const temp = Math.max(20, r);
-                                r = Math.max(20, b);
-                                b = Math.max(20, g);
-                                g = temp;
-                            }
 
-                            newFrame[targetY][targetX] = {
-                                r: Math.floor(r),
-                                g: Math.floor(g),
-                                b: Math.floor(b)
-                            };
-                        } else {
-                            newFrame[targetY][targetX] = sourcePixel;
-                        }
-                    }
+                    // Black source pixels stay black in the tinted frame
+                    newFrame[targetRow + targetX] = tintedFrame[sourceRow + sourceX];
                 }
             }
         });
@@ -460,11 +478,10 @@ class LEDMatrixSimulator {
     }
 
     applySplitMoveEffect(frame) {
-        const newFrame = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        const size = this.matrixSize;
+        const newFrame = this.clearFrameBuffer();
 
-        const quadrantSize = this.matrixSize / 2;
+        const quadrantSize = size / 2;
 
         // Define the 4 quadrant positions with separate move data for each
         const quadrants = [
@@ -491,7 +508,7 @@ class LEDMatrixSimulator {
         quadrants.forEach((quadrant, quadIndex) => {
             const moveData = this.quadrantMoveData[quadIndex];
             this.updateQuadrantMovement(moveData, quadrantSize);
-            const modType = colorMods[quadIndex];
+            const tintedFrame = this.getColorModFrame(frame, colorMods[quadIndex], true);
 
             // Use the same size as static split effect (fills entire quadrant)
             let birdSize = quadrantSize;
@@ -515,65 +532,35 @@ class LEDMatrixSimulator {
 
             // Iterate through each pixel in the quadrant
             for (let qy = 0; qy < quadrantSize; qy++) {
+                const targetY = quadrant.offsetY + qy;
+
+                // Skip rows outside our scaled hummingbird
+                if (targetY < offsetY || targetY >= offsetY + birdSize) continue;
+
+                // Map the row back to original image coordinates (scale up to original image size)
+                const relativeY = targetY - offsetY;
+                const sourceY = Math.floor((relativeY / birdSize) * size);
+                // targetY never leaves the quadrant and relativeY >= 0; only the scaled source row needs checking
+                if (sourceY >= size) continue;
+
+                const sourceRow = sourceY * size;
+                const targetRow = targetY * size;
+
                 for (let qx = 0; qx < quadrantSize; qx++) {
                     const targetX = quadrant.offsetX + qx;
-                    const targetY = quadrant.offsetY + qy;
 
                     // Check if this pixel is within the bounds of our scaled hummingbird
-                    if (targetX >= offsetX && targetX < offsetX + birdSize &&
-                        targetY >= offsetY && targetY < offsetY + birdSize) {
-
-                        // Map back to original image coordinates
+                    if (targetX >= offsetX && targetX < offsetX + birdSize) {
                         const relativeX = targetX - offsetX; // Position within the scaled bird
-                        const relativeY = targetY - offsetY;
-
-                        // Map to source coordinates (scale up to original image size)
-                        const sourceX = Math.floor((relativeX / birdSize) * this.matrixSize);
-                        const sourceY = Math.floor((relativeY / birdSize) * this.matrixSize);
+                        const sourceX = Math.floor((relativeX / birdSize) * size);
 
-                        // Ensure we're within bounds and target is within our quadrant
-                        if (sourceX >= 0 && sourceX < this.matrixSize &&
-                            sourceY >= 0 && sourceY < this.matrixSize &&
-                            targetX >= 0 && targetX < this.matrixSize &&
-                            targetY >= 0 && targetY < this.matrixSize) {
-
-                            const sourcePixel = frame[sourceY][sourceX];
+                        // targetX never leaves the quadrant; only the scaled source column needs checking
+                        if (sourceX < size) {
+                            const tintedPixel = tintedFrame[sourceRow + sourceX];
 
                             // Only process non-black pixels
-                            if (sourcePixel.r > 0 || sourcePixel.g > 0 || sourcePixel.b > 0) {
-                                let r = sourcePixel.r;
-                                let g = sourcePixel.g;
-                                let b = sourcePixel.b;
-
-                                // Apply color modification based on quadrant
-                                if (modType === 0) {
-                                    // Hue shift towards red
-                                    r = Math.min(255, Math.max(30, r * 1.3));
-                                    g = Math.max(20, Math.floor(g * 0.7));
-                                    b = Math.max(20, Math.floor(b * 0.6));
-                                } else if (modType === 1) {
-                                    // Hue shift towards blue  
-                                    r = Math.max(20, Math.floor(r * 0.6));
-                                    g = Math.max(20, Math.floor(g * 0.8));
-                                    b = Math.min(255, Math.max(30, b * 1.4));
-                                } else if (modType === 4) {
-                                    // Increase saturation and brightness
-                                    r = Math.min(240, Math.max(25, r * 1.2));
-                                    g = Math.min(240, Math.max(25, g * 1.2));
-                                    b = Math.min(240, Math.max(25, b * 1.2));
-                                } else if (modType === 5) {
-                                    // Swap color channels (ensure minimum values)
-                                    const temp = Math.max(20, r);
-                                    r = Math.max(20, b);
-                                    b = Math.max(20, g);
-                                    g = temp;
-                                }
-
-                                newFrame[targetY][targetX] = {
-                                    r: Math.floor(r),
-                                    g: Math.floor(g),
-                                    b: Math.floor(b)
-                                };
+                            if (tintedPixel !== 0) {
+                                newFrame[targetRow + targetX] = tintedPixel;
                             }
                         }
                     }
@@ -629,9 +616,7 @@ class LEDMatrixSimulator {
     }
 
     applyMoveEffect(frame) {
-        const newFrame = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        const newFrame = this.clearFrameBuffer();
 
         this.updateHummingbirdMovement();
 
@@ -639,33 +624,13 @@ class LEDMatrixSimulator {
         const currentPos = this.moveData.currentPos;
 
         // Apply scale and position based on movement
-        const scaledSize = Math.floor(this.matrixSize * this.scale);
-        const offsetX = currentPos.x - scaledSize / 2;
-        const offsetY = currentPos.y - scaledSize / 2;
-
-        for (let y = 0; y < scaledSize; y++) {
-            for (let x = 0; x < scaledSize; x++) {
-                const sourceX = Math.floor(x / this.scale);
-                const sourceY = Math.floor(y / this.scale);
-                const targetX = Math.floor(offsetX + x);
-                const targetY = Math.floor(offsetY + y);
-
-                if (sourceX >= 0 && sourceX < this.matrixSize &&
-                    sourceY >= 0 && sourceY < this.matrixSize &&
-                    targetX >= 0 && targetX < this.matrixSize &&
-                    targetY >= 0 && targetY < this.matrixSize) {
-                    newFrame[targetY][targetX] = frame[sourceY][sourceX];
-                }
-            }
-        }
+        this.drawScaledFrame(newFrame, frame, currentPos.x, currentPos.y, this.scale);
 
         return newFrame;
     }
 
     applyPollinationEffect(frame) {
-        const newFrame = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        const newFrame = this.clearFrameBuffer();
 
         this.updatePollinationAnimation();
 
@@ -702,9 +667,7 @@ class LEDMatrixSimulator {
     }
 
     applyCultEffect(frame) {
-        const newFrame = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        const newFrame = this.clearFrameBuffer();
 
         // Initialize cult birds if needed
         if (!this.cultData.initialized) {
@@ -874,81 +837,93 @@ class LEDMatrixSimulator {
     drawFlowerAtPosition(targetFrame, centerX, centerY, scale = 0.6) {
         if (!this.flowerFrame) return;
 
-        const scaledSize = Math.floor(this.matrixSize * scale);
-        const offsetX = centerX - scaledSize / 2;
-        const offsetY = centerY - scaledSize / 2;
-
-        for (let y = 0; y < scaledSize; y++) {
-            for (let x = 0; x < scaledSize; x++) {
-                const sourceX = Math.floor(x / scale);
-                const sourceY = Math.floor(y / scale);
-                const targetX = Math.floor(offsetX + x);
-                const targetY = Math.floor(offsetY + y);
-
-                if (sourceX >= 0 && sourceX < this.matrixSize &&
-                    sourceY >= 0 && sourceY < this.matrixSize &&
-                    targetX >= 0 && targetX < this.matrixSize &&
-                    targetY >= 0 && targetY < this.matrixSize) {
-
-                    const sourcePixel = this.flowerFrame[sourceY][sourceX];
-                    if (sourcePixel.r > 0 || sourcePixel.g > 0 || sourcePixel.b > 0) {
-                        targetFrame[targetY][targetX] = sourcePixel;
-                    }
-                }
-            }
-        }
+        this.drawSpriteRuns(targetFrame, this.flowerFrame, centerX, centerY, scale);
     }
 
 
     drawHummingbirdAtPosition(targetFrame, sourceFrame, centerX, centerY, scale) {
-        const scaledSize = Math.floor(this.matrixSize * scale);
-        const offsetX = centerX - scaledSize / 2;
-        const offsetY = centerY - scaledSize / 2;
+        this.drawSpriteRuns(targetFrame, sourceFrame, centerX, centerY, scale);
+    }
+
+    drawColoredHummingbirdAtPosition(targetFrame, sourceFrame, centerX, centerY, scale, bird) {
+        this.drawSpriteRuns(targetFrame, sourceFrame, centerX, centerY, scale, bird);
+    }
+
+    getSpriteRuns(sourceFrame) {
+        const size = this.matrixSize;
+        // Split each row into runs of same-colored lit pixels so sprites can be drawn run by run.
+        // Runs are packed two words each: (start << 8) | end, then the color; rowOffsets[y] indexes row y's first run.
+        let spriteRuns = this.spriteRuns.get(sourceFrame);
+        if (!spriteRuns) {
+            const rowOffsets = new Uint32Array(size + 1);
+            const packedRuns = [];
+
+            for (let y = 0; y < size; y++) {
+                const rowStart = y * size;
+                let x = 0;
+
+                rowOffsets[y] = packedRuns.length;
+                while (x < size) {
+                    const color = sourceFrame[rowStart + x];
+                    if (color === 0) {
+                        x++;
+                        continue;
+                    }
 
-        for (let y = 0; y < scaledSize; y++) {
-            for (let x = 0; x < scaledSize; x++) {
-                const sourceX = Math.floor(x / scale);
-                const sourceY = Math.floor(y / scale);
-                const targetX = Math.floor(offsetX + x);
-                const targetY = Math.floor(offsetY + y);
-
-                if (sourceX >= 0 && sourceX < this.matrixSize &&
-                    sourceY >= 0 && sourceY < this.matrixSize &&
-                    targetX >= 0 && targetX < this.matrixSize &&
-                    targetY >= 0 && targetY < this.matrixSize) {
-
-                    const sourcePixel = sourceFrame[sourceY][sourceX];
-                    if (sourcePixel.r > 0 || sourcePixel.g > 0 || sourcePixel.b > 0) {
-                        targetFrame[targetY][targetX] = sourcePixel;
+                    let end = x;
+                    while (end + 1 < size && sourceFrame[rowStart + end + 1] === color) {
+                        end++;
                     }
+                    packedRuns.push((x << 8) | end, color);
+                    x = end + 1;
                 }
             }
+            rowOffsets[size] = packedRuns.length;
+
+            spriteRuns = { rowOffsets, runs: Uint32Array.from(packedRuns) };
+            this.spriteRuns.set(sourceFrame, spriteRuns);
         }
+        return spriteRuns;
     }
 
-    drawColoredHummingbirdAtPosition(targetFrame, sourceFrame, centerX, centerY, scale, bird) {
-        const scaledSize = Math.floor(this.matrixSize * scale);
+    drawSpriteRuns(targetFrame, sourceFrame, centerX, centerY, scale, bird = null) {
+        const size = this.matrixSize;
+        const { rowOffsets, runs } = this.getSpriteRuns(sourceFrame);
+        const huePalette = bird ? bird.huePalette : null;
+        const scaledSize = Math.floor(size * scale);
         const offsetX = centerX - scaledSize / 2;
         const offsetY = centerY - scaledSize / 2;
 
-        for (let y = 0; y < scaledSize; y++) {
-            for (let x = 0; x < scaledSize; x++) {
-                const sourceX = Math.floor(x / scale);
-                const sourceY = Math.floor(y / scale);
-                const targetX = Math.floor(offsetX + x);
-                const targetY = Math.floor(offsetY + y);
-
-                if (sourceX >= 0 && sourceX < this.matrixSize &&
-                    sourceY >= 0 && sourceY < this.matrixSize &&
-                    targetX >= 0 && targetX < this.matrixSize &&
-                    targetY >= 0 && targetY < this.matrixSize) {
-
-                    const sourcePixel = sourceFrame[sourceY][sourceX];
-                    if (sourcePixel.r > 0 || sourcePixel.g > 0 || sourcePixel.b > 0) {
-                        // Apply color transformation based on bird's hue
-                        const coloredPixel = this.applyHueShift(sourcePixel, bird.hue, bird.saturation, bird.brightness);
-                        targetFrame[targetY][targetX] = coloredPixel;
+        // Clip to the panel once up front instead of testing every target pixel
+        const [xStart, xEnd] = this.getClippedRange(offsetX, scaledSize);
+        const [yStart, yEnd] = this.getClippedRange(offsetY, scaledSize);
+
+        for (let y = yStart; y < yEnd; y++) {
+            const sourceY = Math.floor(y / scale);
+            const targetRow = Math.floor(offsetY + y) * size;
+
+            for (let k = rowOffsets[sourceY]; k < rowOffsets[sourceY + 1]; k += 2) {
+                const runStart = runs[k] >> 8;
+                const runEnd = runs[k] & 0xFF;
+
+                // Color is resolved once per run rather than per pixel; hue shifts are looked up, not recomputed
+                let color = runs[k + 1];
+                if (huePalette) {
+                    let shiftedColor = huePalette.get(color);
+                    if (shiftedColor === undefined) {
+                        shiftedColor = this.applyHueShift(color, bird.hue, bird.saturation, bird.brightness);
+                        huePalette.set(color, shiftedColor);
                     }
+                    color = shiftedColor;
+                }
+
+                // Start just before the first scaled pixel that samples this run and stop once past its end
+                for (let x = Math.max(xStart, Math.floor(runStart * scale) - 1); x < xEnd; x++) {
+                    const sourceX = Math.floor(x / scale);
+                    if (sourceX > runEnd) break;
+                    if (sourceX < runStart) continue;
+
+                    targetFrame[targetRow + Math.floor(offsetX + x)] = color;
                 }
             }
         }
@@ -956,9 +931,9 @@ class LEDMatrixSimulator {
 
     applyHueShift(pixel, hue, saturation, brightness) {
         // Convert RGB to HSL, apply hue shift, convert back to RGB
-        const r = pixel.r / 255;
-        const g = pixel.g / 255;
-        const b = pixel.b / 255;
+        const r = ((pixel >> 16) & 0xFF) / 255;
+        const g = ((pixel >> 8) & 0xFF) / 255;
+        const b = (pixel & 0xFF) / 255;
 
         // Convert RGB to HSL
         const max = Math.max(r, g, b);
@@ -994,11 +969,7 @@ class LEDMatrixSimulator {
         else if (h < 300) { newR = x; newG = 0; newB = c; }
         else { newR = c; newG = 0; newB = x; }
 
-        return {
-            r: Math.floor((newR + m) * 255),
-            g: Math.floor((newG + m) * 255),
-            b: Math.floor((newB + m) * 255)
-        };
+        return this.packColor((newR + m) * 255, (newG + m) * 255, (newB + m) * 255);
     }
 
     updateHummingbirdMovement() {
@@ -1058,9 +1029,7 @@ class LEDMatrixSimulator {
     }
 
     applySwarmEffect(frame) {
-        const newFrame = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        const newFrame = this.clearFrameBuffer();
 
         const time = Date.now() / 1000;
         const numBirds = Math.min(this.maxSwarmBirds, this.matrixSize === 32 ? this.maxSwarmBirds : this.maxSwarmBirds);
@@ -1082,9 +1051,27 @@ class LEDMatrixSimulator {
             this.drawBirdWithColorMod(frame, newFrame, birdData.x, birdData.y, scale * birdData.sizeVariation, bird, time);
         }
 
+        // Debug one bird per interval, rotating through the swarm so every speed in the slider range gets reported
+        const now = performance.now();
+        if (now - this.lastMovementLogTime >= this.movementLogInterval) {
+            this.lastMovementLogTime = now;
+            this.movementLogBirdIndex = (this.movementLogBirdIndex + 1) % numBirds;
+            this.logBirdMovement(this.movementLogBirdIndex, extendedSize);
+        }
+
         return newFrame;
     }
 
+    logBirdMovement(birdIndex, extendedSize) {
+        // Same speed math as updateBirdMovement(); only evaluated when a log is due
+        const bird = this.swarmBirds[birdIndex];
+        const effectiveSpeed = Math.max(0.01, Math.min(4.0, bird.currentSpeed));
+        const progressPerFrame = (effectiveSpeed * 0.5) / (extendedSize + extendedSize / 2);
+
+        console.log(`🐦 Speed Debug (bird ${birdIndex}): baseSpeed=${bird.baseSpeed.toFixed(3)}, currentSpeed=${bird.currentSpeed.toFixed(3)}, effectiveSpeed=${effectiveSpeed.toFixed(3)}, progressPerFrame=${progressPerFrame.toFixed(6)}, sliderRange=${this.swarmMinSpeed.toFixed(2)}-${this.swarmMaxSpeed.toFixed(2)}`);
+        console.log(`🎯 Bird movement (bird ${birdIndex}): dir=${bird.direction}, progress=${bird.continuousProgress.toFixed(4)}, x=${bird.x.toFixed(1)}, y=${bird.y.toFixed(1)}, speed=${effectiveSpeed.toFixed(3)}`);
+    }
+
     initializeSwarmBirds(numBirds, extendedSize) {
         this.swarmBirds = [];
 
@@ -1210,11 +1197,6 @@ class LEDMatrixSimulator {
         const speedMultiplier = 0.5; // User requested slower baseline speed (was 8.0)
         const progressPerFrame = (effectiveSpeed * speedMultiplier) / trajectoryRange;
 
-        // Enhanced debug logging to identify slider issues
-        if (Math.random() < 0.01) { // More frequent logging during debugging
-            console.log(`🐦 Speed Debug: baseSpeed=${bird.baseSpeed.toFixed(3)}, currentSpeed=${bird.currentSpeed.toFixed(3)}, effectiveSpeed=${effectiveSpeed.toFixed(3)}, progressPerFrame=${progressPerFrame.toFixed(6)}, sliderRange=${this.swarmMinSpeed.toFixed(2)}-${this.swarmMaxSpeed.toFixed(2)}`);
-        }
-
         // Update continuous progress (always smooth, no jumps possible)
         bird.continuousProgress += progressPerFrame;
 
@@ -1251,17 +1233,10 @@ class LEDMatrixSimulator {
 
         // Track total distance for debugging
         bird.totalDistance += effectiveSpeed * speedMultiplier;
-
-        // Debug position changes occasionally
-        if (Math.random() < 0.005) { // Log position changes
-            console.log(`🎯 Bird movement: dir=${bird.direction}, progress=${bird.continuousProgress.toFixed(4)}, x=${bird.x.toFixed(1)}, y=${bird.y.toFixed(1)}, speed=${effectiveSpeed.toFixed(3)}`);
-        }
     }
 
     applySplitSwarmEffect(frame) {
-        const newFrame = Array(this.matrixSize).fill().map(() =>
-            Array(this.matrixSize).fill({ r: 0, g: 0, b: 0 })
-        );
+        const newFrame = this.clearFrameBuffer();
 
         const time = Date.now() / 1000;
         const quadrantSize = this.matrixSize / 2;
@@ -1356,59 +1331,108 @@ class LEDMatrixSimulator {
         return newFrame;
     }
 
+    getColorModFrame(sourceFrame, modType, clampColors) {
+        // Recolor the whole source frame once per color modification and reuse it while the frame is shown
+        let modFrames = this.colorModFrames.get(sourceFrame);
+        if (!modFrames) {
+            modFrames = [];
+            this.colorModFrames.set(sourceFrame, modFrames);
+        }
+
+        const key = modType * 2 + (clampColors ? 1 : 0);
+        if (!modFrames[key]) {
+            const tintedFrame = new Uint32Array(sourceFrame.length);
+            for (let i = 0; i < sourceFrame.length; i++) {
+                // Black stays black so the tinted frame keeps the sprite's transparency
+                if (sourceFrame[i] !== 0) {
+                    tintedFrame[i] = this.applyColorMod(sourceFrame[i], modType, clampColors);
+                }
+            }
+            modFrames[key] = tintedFrame;
+        }
+        return modFrames[key];
+    }
+
+    applyColorMod(pixel, modType, clampColors) {
+        let r = (pixel >> 16) & 0xFF;
+        let g = (pixel >> 8) & 0xFF;
+        let b = pixel & 0xFF;
+
+        if (clampColors) {
+            // Clamped variants keep every channel above a minimum so modified birds stay visible
+            if (modType === 0) {
+                // Hue shift towards red
+                r = Math.min(255, Math.max(30, r * 1.3));
+                g = Math.max(20, Math.floor(g * 0.7));
+                b = Math.max(20, Math.floor(b * 0.6));
+            } else if (modType === 1) {
+                // Hue shift towards blue
+                r = Math.max(20, Math.floor(r * 0.6));
+                g = Math.max(20, Math.floor(g * 0.8));
+                b = Math.min(255, Math.max(30, b * 1.4));
+            } else if (modType === 2) {
+                // Hue shift towards purple/magenta
+                r = Math.min(255, Math.max(30, r * 1.2));
+                g = Math.max(20, Math.floor(g * 0.7));
+                b = Math.min(255, Math.max(30, b * 1.3));
+            } else if (modType === 3) {
+                // Hue shift towards green/yellow
+                r = Math.min(240, Math.max(25, r * 1.1));
+                g = Math.min(255, Math.max(30, g * 1.3));
+                b = Math.max(20, Math.floor(b * 0.6));
+            } else if (modType === 4) {
+                // Increase saturation and brightness
+                r = Math.min(240, Math.max(25, r * 1.2));
+                g = Math.min(240, Math.max(25, g * 1.2));
+                b = Math.min(240, Math.max(25, b * 1.2));
+            } else {
+                // Swap color channels (ensure minimum values)
+                const temp = Math.max(20, r);
+                r = Math.max(20, b);
+                b = Math.max(20, g);
+                g = temp;
+            }
+        } else {
+            if (modType === 0) {
+                r = Math.min(255, r * 1.3); g = Math.floor(g * 0.7); b = Math.floor(b * 0.6);
+            } else if (modType === 1) {
+                r = Math.floor(r * 0.6); g = Math.floor(g * 0.8); b = Math.min(255, b * 1.4);
+            } else if (modType === 2) {
+                r = Math.min(255, r * 1.2); g = Math.floor(g * 0.7); b = Math.min(255, b * 1.3);
+            } else if (modType === 3) {
+                r = Math.min(255, r * 1.1); g = Math.min(255, g * 1.3); b = Math.floor(b * 0.6);
+            } else if (modType === 4) {
+                r = Math.min(255, r * 1.2); g = Math.min(255, g * 1.2); b = Math.min(255, b * 1.2);
+            } else {
+                const temp = r; r = b; b = g; g = temp;
+            }
+        }
+
+        return this.packColor(r, g, b);
+    }
+
     drawBirdWithColorMod(sourceFrame, targetFrame, centerX, centerY, scale, birdId, time) {
-        for (let y = 0; y < this.matrixSize; y++) {
-            for (let x = 0; x < this.matrixSize; x++) {
-                const sourceX = Math.floor((x - centerX) / scale + this.matrixSize / 2);
-                const sourceY = Math.floor((y - centerY) / scale + this.matrixSize / 2);
+        const size = this.matrixSize;
+        const halfSize = size / 2;
+        // Different color modification per bird
+        const tintedFrame = this.getColorModFrame(sourceFrame, birdId % 6, true);
 
-                if (sourceX >= 0 && sourceX < this.matrixSize &&
-                    sourceY >= 0 && sourceY < this.matrixSize &&
-                    sourceFrame[sourceY][sourceX].r > 0) {
+        for (let y = 0; y < size; y++) {
+            const sourceY = Math.floor((y - centerY) / scale + halfSize);
+            if (sourceY < 0 || sourceY >= size) continue;
 
-                    // Only overwrite if target pixel is empty to avoid overlapping
-                    if (targetFrame[y][x].r === 0 && targetFrame[y][x].g === 0 && targetFrame[y][x].b === 0) {
-                        let r = sourceFrame[sourceY][sourceX].r;
-                        let g = sourceFrame[sourceY][sourceX].g;
-                        let b = sourceFrame[sourceY][sourceX].b;
-
-                        // Apply different color modifications based on bird ID
-                        const modType = birdId % 6;
-
-                        if (modType === 0) {
-                            // Hue shift towards red
-                            r = Math.min(255, Math.max(30, r * 1.3));
-                            g = Math.max(20, Math.floor(g * 0.7));
-                            b = Math.max(20, Math.floor(b * 0.6));
-                        } else if (modType === 1) {
-                            // Hue shift towards blue  
-                            r = Math.max(20, Math.floor(r * 0.6));
-                            g = Math.max(20, Math.floor(g * 0.8));
-                            b = Math.min(255, Math.max(30, b * 1.4));
-                        } else if (modType === 2) {
-                            // Hue shift towards purple/magenta
-                            r = Math.min(255, Math.max(30, r * 1.2));
-                            g = Math.max(20, Math.floor(g * 0.7));
-                            b = Math.min(255, Math.max(30, b * 1.3));
-                        } else if (modType === 3) {
-                            // Hue shift towards green/yellow
-                            r = Math.min(240, Math.max(25, r * 1.1));
-                            g = Math.min(255, Math.max(30, g * 1.3));
-                            b = Math.max(20, Math.floor(b * 0.6));
-                        } else if (modType === 4) {
-                            // Increase saturation and brightness
-                            r = Math.min(240, Math.max(25, r * 1.2));
-                            g = Math.min(240, Math.max(25, g * 1.2));
-                            b = Math.min(240, Math.max(25, b * 1.2));
-                        } else {
-                            // Swap color channels (ensure minimum values)
-                            const temp = Math.max(20, r);
-                            r = Math.max(20, b);
-                            b = Math.max(20, g);
-                            g = temp;
-                        }
+            const sourceRow = sourceY * size;
+            const targetRow = y * size;
+
+            for (let x = 0; x < size; x++) {
+                const sourceX = Math.floor((x - centerX) / scale + halfSize);
 
-                        targetFrame[y][x] = { r: Math.floor(r), g: Math.floor(g), b: Math.floor(b) };
+                if (sourceX >= 0 && sourceX < size &&
+                    (sourceFrame[sourceRow + sourceX] >> 16) > 0) {
+
+                    // Only overwrite if target pixel is empty to avoid overlapping
+                    if (targetFrame[targetRow + x] === 0) {
+                        targetFrame[targetRow + x] = tintedFrame[sourceRow + sourceX];
                     }
                 }
             }
@@ -1416,45 +1440,27 @@ class LEDMatrixSimulator {
     }
 
     drawBirdClippedToQuadrant(sourceFrame, targetFrame, centerX, centerY, scale, birdId, time, quadrant, quadrantSize) {
-        for (let y = 0; y < this.matrixSize; y++) {
-            for (let x = 0; x < this.matrixSize; x++) {
-                // Only draw within this quadrant
-                if (x >= quadrant.offsetX && x < quadrant.offsetX + quadrantSize &&
-                    y >= quadrant.offsetY && y < quadrant.offsetY + quadrantSize) {
-
-                    const sourceX = Math.floor((x - centerX) / scale + this.matrixSize / 2);
-                    const sourceY = Math.floor((y - centerY) / scale + this.matrixSize / 2);
-
-                    if (sourceX >= 0 && sourceX < this.matrixSize &&
-                        sourceY >= 0 && sourceY < this.matrixSize &&
-                        sourceFrame[sourceY][sourceX].r > 0) {
-
-                        // Only overwrite if target pixel is empty
-                        if (targetFrame[y][x].r === 0 && targetFrame[y][x].g === 0 && targetFrame[y][x].b === 0) {
-                            let r = sourceFrame[sourceY][sourceX].r;
-                            let g = sourceFrame[sourceY][sourceX].g;
-                            let b = sourceFrame[sourceY][sourceX].b;
-
-                            // Apply color modifications
-                            const modType = birdId % 6;
-                            if (modType === 0) {
-                                r = Math.min(255, r * 1.3); g = Math.floor(g * 0.7); b = Math.floor(b * 0.6);
-                            } else if (modType === 1) {
-                                r = Math.floor(r * 0.6); g = Math.floor(g * 0.8); b = Math.min(255, b * 1.4);
-                            } else if (modType === 2) {
-                                // Hue shift towards purple/magenta
-                                r = Math.min(255, r * 1.2); g = Math.floor(g * 0.7); b = Math.min(255, b * 1.3);
-                            } else if (modType === 3) {
-                                // Hue shift towards green/yellow
-                                r = Math.min(255, r * 1.1); g = Math.min(255, g * 1.3); b = Math.floor(b * 0.6);
-                            } else if (modType === 4) {
-                                r = Math.min(255, r * 1.2); g = Math.min(255, g * 1.2); b = Math.min(255, b * 1.2);
-                            } else {
-                                const temp = r; r = b; b = g; g = temp;
-                            }
+        const size = this.matrixSize;
+        const halfSize = size / 2;
+        const tintedFrame = this.getColorModFrame(sourceFrame, birdId % 6, false);
 
-                            targetFrame[y][x] = { r: Math.floor(r), g: Math.floor(g), b: Math.floor(b) };
-                        }
+        // Only visit rows and columns within this quadrant
+        for (let y = quadrant.offsetY; y < quadrant.offsetY + quadrantSize; y++) {
+            const sourceY = Math.floor((y - centerY) / scale + halfSize);
+            if (sourceY < 0 || sourceY >= size) continue;
+
+            const sourceRow = sourceY * size;
+            const targetRow = y * size;
+
+            for (let x = quadrant.offsetX; x < quadrant.offsetX + quadrantSize; x++) {
+                const sourceX = Math.floor((x - centerX) / scale + halfSize);
+
+                if (sourceX >= 0 && sourceX < size &&
+                    (sourceFrame[sourceRow + sourceX] >> 16) > 0) {
+
+                    // Only overwrite if target pixel is empty
+                    if (targetFrame[targetRow + x] === 0) {
+                        targetFrame[targetRow + x] = tintedFrame[sourceRow + sourceX];
                     }
                 }
             }
@@ -1466,30 +1472,51 @@ class LEDMatrixSimulator {
         this.drawBirdWithColorMod(sourceFrame, targetFrame, centerX, centerY, scale, birdId, time);
     }
 
-    renderMatrix() {
-        const leds = document.querySelectorAll('.led');
+    renderMatrix(frame) {
+        const leds = this.leds;
+        const size = this.matrixSize;
+        const previousFrame = this.matrix;
 
-        leds.forEach((led, index) => {
-            const x = index % this.matrixSize;
-            const y = Math.floor(index / this.matrixSize);
-            const pixel = this.matrix[y][x];
+        for (let i = 0; i < size * size; i++) {
+            const pixel = frame[i];
 
-            if (pixel.r > 0 || pixel.g > 0 || pixel.b > 0) {
-                led.classList.add('on');
-                let color = `rgb(${pixel.r}, ${pixel.g}, ${pixel.b})`;
+            // Only touch LEDs whose color changed since the frame currently on screen
+            if (pixel === previousFrame[i]) continue;
 
-                led.style.backgroundColor = color;
-                led.style.color = color;
+            // One class write and one style write per LED; the stylesheet derives background and glow from --led-color
+            const led = leds[i];
+            if (pixel !== 0) {
+                led.className = 'led on';
+                led.style.setProperty('--led-color', this.getPaletteColor(pixel));
             } else {
-                led.classList.remove('on');
-                led.style.backgroundColor = '#000';
-                led.style.color = '#000';
+                led.className = 'led';
+                led.style.setProperty('--led-color', '#000');
             }
-        });
+        }
+        this.matrix = frame;
 
         // Note: Breathing effect is now handled through scale changes in applyScaleAndPosition
     }
 
+    getPaletteColor(pixel) {
+        // Build each CSS color string once and reuse it for every LED showing that color
+        let color = this.colorPalette.get(pixel);
+        if (color === undefined) {
+            color = `rgb(${(pixel >> 16) & 0xFF}, ${(pixel >> 8) & 0xFF}, ${pixel & 0xFF})`;
+            this.colorPalette.set(pixel, color);
+        }
+        return color;
+    }
+
+    packColor(r, g, b) {
+        return (Math.floor(r) << 16) | (Math.floor(g) << 8) | Math.floor(b);
+    }
+
+    toRGB565(pixel) {
+        // Quantize packed 0xRRGGBB to 5-6-5 bits, matching what the HUB75 panel can show
+        return ((pixel >> 8) & 0xF800) | ((pixel >> 5) & 0x07E0) | ((pixel >> 3) & 0x001F);
+    }
+
     hslToRgb(h, s, l) {
         h /= 360;
         const a = s * Math.min(l, 1 - l);
@@ -1523,7 +1550,7 @@ class LEDMatrixSimulator {
             document.getElementById('speedValue').textContent = `${this.animationSpeed}ms`;
             // Reset timing to prevent glitches when changing speed
             if (this.isPlaying) {
-                this.lastFrameTime = performance.now();
+                this.nextFrameTime = performance.now() + this.animationSpeed;
             }
         });
 
@@ -1531,6 +1558,7 @@ class LEDMatrixSimulator {
         const sizeSlider = document.getElementById('sizeSlider');
         sizeSlider.addEventListener('change', (e) => {
             this.scale = parseInt(e.target.value) / 100;
+            this.prerenderedFrames = null; // Re-render frames at the new scale
             document.getElementById('sizeValue').textContent = `${e.target.value}%`;
             this.displayFrame(this.currentFrame);
         });
@@ -1685,19 +1713,22 @@ class LEDMatrixSimulator {
         if (this.isPlaying) return;
 
         this.isPlaying = true;
-        this.lastFrameTime = performance.now();
+        this.nextFrameTime = performance.now() + this.animationSpeed;
         this.updateControls();
 
         const animate = (currentTime) => {
             if (!this.isPlaying) return;
 
-            // Check if enough time has passed for the next frame
-            const deltaTime = currentTime - this.lastFrameTime;
-
-            if (deltaTime >= this.animationSpeed) {
+            // Advance on fixed deadlines so late callbacks don't push every following frame back
+            if (currentTime >= this.nextFrameTime) {
                 this.displayFrame(this.currentFrame);
                 this.currentFrame = (this.currentFrame + 1) % this.frames.length;
-                this.lastFrameTime = currentTime;
+                this.nextFrameTime += this.animationSpeed;
+
+                // Resync instead of bursting through missed frames (e.g. after the tab was hidden)
+                if (currentTime >= this.nextFrameTime) {
+                    this.nextFrameTime = currentTime + this.animationSpeed;
+                }
             }
 
             this.animationId = requestAnimationFrame(animate);
@@ -1794,6 +1825,8 @@ class LEDMatrixSimulator {
             this.quadrantMoveData = null;
         }
 
+        this.updateEffectRenderer();
+
         // Update button states
         const buttons = document.querySelectorAll('.effect-btn');
         buttons.forEach(btn => {
@@ -1833,33 +1866,73 @@ class LEDMatrixSimulator {
         const frameData = {
             frame: this.currentFrame,
             timestamp: Date.now(),
-            matrix: this.matrix.map(row =>
-                row.map(pixel => ({
-                    r: pixel.r,
-                    g: pixel.g,
-                    b: pixel.b,
-                    on: pixel.r > 0 || pixel.g > 0 || pixel.b > 0
+            // Same [row][column] shape as before frames were packed into flat buffers
+            matrix: Array.from({ length: this.matrixSize }, (_, y) =>
+                Array.from(this.matrix.subarray(y * this.matrixSize, (y + 1) * this.matrixSize), pixel => ({
+                    r: (pixel >> 16) & 0xFF,
+                    g: (pixel >> 8) & 0xFF,
+                    b: pixel & 0xFF,
+                    on: pixel !== 0
                 }))
             )
         };
 
         // Arduino-compatible format
+        const frameName = `frame${this.currentFrame + 1}`;
+        const pixelCount = this.matrixSize * this.matrixSize;
+        const toHex = value => `0x${value.toString(16).toUpperCase().padStart(4, '0')}`;
+
+        // Quantize to RGB565 and assign palette indices in a single pass, keeping black at index 0
+        const rgb565 = new Uint16Array(pixelCount);
+        const colorIndices = new Uint16Array(pixelCount);
+        const paletteIndices = new Map([[0, 0]]);
+        for (let i = 0; i < pixelCount; i++) {
+            const color = this.toRGB565(this.matrix[i]);
+            let index = paletteIndices.get(color);
+            if (index === undefined) {
+                index = paletteIndices.size;
+                paletteIndices.set(color, index);
+            }
+            rgb565[i] = color;
+            colorIndices[i] = index;
+        }
+
         let arduinoCode = `// Frame ${this.currentFrame + 1} - Generated at ${new Date().toLocaleString()}\n`;
-        arduinoCode += `// Matrix size: ${this.matrixSize}x${this.matrixSize}\n\n`;
+        arduinoCode += `// Matrix size: ${this.matrixSize}x${this.matrixSize}\n`;
 
-        arduinoCode += `const uint8_t frame${this.currentFrame + 1}_data_${this.matrixSize}x${this.matrixSize}[${this.matrixSize}][${this.matrixSize}][3] = {\n`;
+        if (paletteIndices.size <= 256) {
+            const packNibbles = paletteIndices.size <= 16;
 
-        for (let y = 0; y < this.matrixSize; y++) {
-            arduinoCode += '  {\n';
-            for (let x = 0; x < this.matrixSize; x++) {
-                const pixel = this.matrix[y][x];
-                arduinoCode += `    {${pixel.r}, ${pixel.g}, ${pixel.b}}`;
-                if (x < this.matrixSize - 1) arduinoCode += ',';
-                arduinoCode += '\n';
+            // One byte per pixel instead of two, or two pixels per byte when 16 colors are enough
+            if (packNibbles) {
+                arduinoCode += `// Format: 4-bit palette indices, two per byte (high nibble first), row-major; look up each index in ${frameName}_palette (RGB565)\n\n`;
+            } else {
+                arduinoCode += `// Format: 8-bit palette indices, row-major; look up each index in ${frameName}_palette (RGB565)\n\n`;
             }
-            arduinoCode += '  }';
-            if (y < this.matrixSize - 1) arduinoCode += ',';
-            arduinoCode += '\n';
+
+            arduinoCode += `const uint16_t ${frameName}_palette[${paletteIndices.size}] = {\n`;
+            arduinoCode += this.formatArduinoRows(Array.from(paletteIndices.keys()), 16, toHex);
+            arduinoCode += '};\n\n';
+
+            if (packNibbles) {
+                const packedIndices = new Uint8Array(Math.ceil(pixelCount / 2));
+                for (let i = 0; i < pixelCount; i += 2) {
+                    const low = i + 1 < pixelCount ? colorIndices[i + 1] : 0;
+                    packedIndices[i >> 1] = (colorIndices[i] << 4) | low;
+                }
+
+                arduinoCode += `const uint8_t ${frameName}_data_${this.matrixSize}x${this.matrixSize}[${packedIndices.length}] = {\n`;
+                arduinoCode += this.formatArduinoRows(packedIndices, this.matrixSize / 2,
+                    value => `0x${value.toString(16).toUpperCase().padStart(2, '0')}`);
+            } else {
+                arduinoCode += `const uint8_t ${frameName}_data_${this.matrixSize}x${this.matrixSize}[${pixelCount}] = {\n`;
+                arduinoCode += this.formatArduinoRows(colorIndices, this.matrixSize, String);
+            }
+        } else {
+            arduinoCode += `// Format: RGB565, row-major (draw with matrix.drawRGBBitmap(0, 0, ..., ${this.matrixSize}, ${this.matrixSize}))\n\n`;
+
+            arduinoCode += `const uint16_t ${frameName}_data_${this.matrixSize}x${this.matrixSize}[${pixelCount}] = {\n`;
+            arduinoCode += this.formatArduinoRows(rgb565, this.matrixSize, toHex);
         }
 
         arduinoCode += '};\n';
@@ -1868,6 +1941,16 @@ class LEDMatrixSimulator {
         console.log('Frame data exported', frameData);
     }
 
+    formatArduinoRows(values, rowLength, formatValue) {
+        let rows = '';
+        for (let i = 0; i < values.length; i++) {
+            if (i % rowLength === 0) rows += '  ';
+            rows += formatValue(values[i]);
+            if (i < values.length - 1) rows += (i + 1) % rowLength === 0 ? ',\n' : ', ';
+        }
+        return rows + '\n';
+    }
+
     // Debug method to monitor bird speeds (available in console)
     debugBirdSpeeds() {
         if (!this.effects.swarm) {